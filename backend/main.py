@@ -44,28 +44,14 @@ def get_artwork(art_id: str):
     # Query by ID:
     cursor.execute("SELECT * FROM artworks WHERE id = ?", (art_id,))
     row = cursor.fetchone()
+    columns = [col[0] for col in cursor.description]
     conn.close()
 
     if not row:
         raise HTTPException(status_code=404, detail="Artwork not found")
 
     # Build Artwork from row
-    artwork = Artwork(
-        id=row[0],
-        museum=row[1],
-        title=row[2],
-        type=row[3],
-        artist_name=row[4],
-        artist_birth=row[5],
-        artist_death=row[6],
-        date_text=row[7],
-        start_year=row[8],
-        end_year=row[9],
-        is_bce=row[10],
-        url=row[11],
-        image_url=row[12],
-    )
-    return artwork
+    return Artwork(**dict(zip(columns, row)))
 
 
 @app.get("/api/artworks")
@@ -154,28 +140,12 @@ def get_artworks(
 
     cursor.execute(data_query, tuple(query_params))
     rows = cursor.fetchall()
+    columns = [col[0] for col in cursor.description]
     conn.close()
 
-    # Convert DB rows to list of dicts/Pydantic models
-    # Make sure the order of columns matches your DB table:
-    # (id, museum, title, type, artist_name, artist_birth, artist_death, date_text, start_year, end_year, url, image_url)
-    artworks = []
-    for row in rows:
-        artworks.append(Artwork(
-            id=row[0],
-            museum=row[1],
-            title=row[2],
-            type=row[3],
-            artist_name=row[4],
-            artist_birth=row[5],
-            artist_death=row[6],
-            date_text=row[7],
-            start_year=row[8],
-            end_year=row[9],
-            is_bce=row[10],
-            url=row[11],
-            image_url=row[12],
-        ))
+    # Convert DB rows to Pydantic models, pairing each value with its column
+    # name once instead of indexing every field by position
+    artworks = [Artwork(**dict(zip(columns, row))) for row in rows]
 
     # Return total + artworks array
     return {"total": total, "artworks": artworks}
@@ -8,7 +8,6 @@ from typing import Dict, List
 from processors.registry import ProcessorRegistry
 from models.data_models import UnifiedArtwork
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -147,6 +146,7 @@ class SimpleMerger:
 
 
 def main():
+    logging.basicConfig(level=logging.INFO)
     merger = SimpleMerger()
     merger.process_museums(Path('../data/source_datasets'))
 
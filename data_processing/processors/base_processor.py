@@ -1,6 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, FrozenSet, Iterable, Tuple
 import pandas as pd
 
 from models.data_models import (
@@ -13,8 +13,7 @@ from models.data_models import (
     DateType
 )
 
-# Configure logging
-logging.basicConfig(level=logging.ERROR, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
 
 
 class BaseMuseumDataProcessor(ABC):
@@ -42,7 +41,7 @@ class BaseMuseumDataProcessor(ABC):
     column_map: Dict[str, Dict[str, Any]] = {}
 
     # If you have columns you *never* want in metadata, place them here
-    exclude_from_metadata: Set[str] = set()
+    exclude_from_metadata: FrozenSet[str] = frozenset()
 
     @abstractmethod
     def load_data(self, file_path: str, dev_mode: bool = False) -> pd.DataFrame:
@@ -57,12 +56,19 @@ class BaseMuseumDataProcessor(ABC):
         Convert the DataFrame into a list of UnifiedArtwork objects.
         """
         artworks = []
-        for index, row in df.iterrows():
+        # Resolved once per DataFrame rather than re-checked on every row
+        metadata_columns = self._get_metadata_columns(df.columns)
+        # Plain dicts are much cheaper to build than the per-row Series that
+        # iterrows() creates, and still support row[col] / row.get(col).
+        # They're built one at a time so we never hold a dict for every row.
+        cols = list(df.columns)
+        for index, values in zip(df.index, df.itertuples(index=False, name=None)):
+            row = dict(zip(cols, values))
             try:
-                artwork = self._row_to_artwork(row, index)
+                artwork = self._row_to_artwork(row, index, metadata_columns)
                 artworks.append(artwork)
             except Exception as e:
-                logging.error(f"Error processing row {row.get('id', index)}: {e}")
+                logger.error(f"Error processing row {row.get('id', index)}: {e}")
         return artworks
 
     def get_unified_data(self, file_path: str, dev_mode: bool = False) -> List[UnifiedArtwork]:
@@ -72,9 +78,15 @@ class BaseMuseumDataProcessor(ABC):
     # -----------------------------------------------------------------
     # Core row -> UnifiedArtwork logic
     # -----------------------------------------------------------------
-    def _row_to_artwork(self, row: pd.Series, index) -> UnifiedArtwork:
+    def _row_to_artwork(
+        self,
+        row: Dict[str, Any],
+        index,
+        metadata_columns: Optional[Tuple[str, ...]] = None
+    ) -> UnifiedArtwork:
         """
         Create a UnifiedArtwork from a single row using column_map, plus fallback logic.
+        metadata_columns comes from _get_metadata_columns; if omitted it's resolved from the row.
         """
         # Start with a new instance (we’ll fill it in piecewise)
         artwork = UnifiedArtwork(
@@ -88,45 +100,44 @@ class BaseMuseumDataProcessor(ABC):
         )
 
         # 1. Apply the column_map to fill fields
-        used_columns = set()
-
         for col_name, config in self.column_map.items():
             if col_name not in row or pd.isna(row[col_name]):
-                logging.debug(f"Row {index}: Skipping column '{col_name}' (missing or NaN).")
+                logger.debug(f"Row {index}: Skipping column '{col_name}' (missing or NaN).")
                 continue
 
             raw_val = row[col_name]
-            used_columns.add(col_name)
 
             # Parse if necessary
             if "parse" in config and callable(config["parse"]):
                 try:
                     parsed_val = config["parse"](raw_val, row)
-                    logging.debug(f"Row {index}: Parsed column '{col_name}' value '{raw_val}' to '{parsed_val}'.")
+                    logger.debug(f"Row {index}: Parsed column '{col_name}' value '{raw_val}' to '{parsed_val}'.")
                 except Exception as e:
-                    logging.error(f"Row {index}: Failed to parse column '{col_name}' with value '{raw_val}': {e}")
+                    logger.error(f"Row {index}: Failed to parse column '{col_name}' with value '{raw_val}': {e}")
                     continue
             else:
                 parsed_val = raw_val
-                logging.debug(f"Row {index}: Using raw column '{col_name}' value '{raw_val}'.")
+                logger.debug(f"Row {index}: Using raw column '{col_name}' value '{raw_val}'.")
 
             # If there's a "model" path, set that field
             if "model" in config:
                 try:
                     self._set_model_field(artwork, config["model"], parsed_val)
-                    logging.debug(f"Row {index}: Set '{config['model']}' to '{parsed_val}'.")
+                    logger.debug(f"Row {index}: Set '{config['model']}' to '{parsed_val}'.")
                 except Exception as e:
-                    logging.error(f"Row {index}: Failed to set field '{config['model']}' with value '{parsed_val}': {e}")
+                    logger.error(f"Row {index}: Failed to set field '{config['model']}' with value '{parsed_val}': {e}")
                     continue
 
         # 2. Fill metadata with leftover columns
-        artwork.metadata = self._create_metadata(row, used_columns)
-        logging.debug(f"Row {index}: Metadata extracted: {artwork.metadata}")
+        if metadata_columns is None:
+            metadata_columns = self._get_metadata_columns(row.keys())
+        artwork.metadata = self._create_metadata(row, index, metadata_columns)
+        logger.debug(f"Row {index}: Metadata extracted: {artwork.metadata}")
 
         # 3. If the ID is still empty, try a default from row['id']
         if not artwork.id and "id" in row and pd.notna(row["id"]):
             artwork.id = str(row["id"])
-            logging.debug(f"Row {index}: Fallback ID set to '{artwork.id}'.")
+            logger.debug(f"Row {index}: Fallback ID set to '{artwork.id}'.")
 
         return artwork
 
@@ -143,15 +154,24 @@ class BaseMuseumDataProcessor(ABC):
             target = getattr(target, attr)
         setattr(target, parts[-1], value)
 
-    def _create_metadata(self, row: pd.Series, used_columns: set) -> dict:
+    def _get_metadata_columns(self, columns: Iterable[str]) -> Tuple[str, ...]:
+        """
+        Return the columns that belong in metadata: everything not handled by
+        column_map and not listed in exclude_from_metadata.
+        """
+        return tuple(
+            col for col in columns
+            if col not in self.column_map and col not in self.exclude_from_metadata
+        )
+
+    def _create_metadata(self, row: Dict[str, Any], index, metadata_columns: Tuple[str, ...]) -> dict:
         """
-        Put all columns not in used_columns or exclude_from_metadata into the metadata dict.
+        Put all non-null metadata_columns (see _get_metadata_columns) into the metadata dict.
         """
         metadata = {}
-        for col in row.index:
-            if col not in used_columns and col not in self.exclude_from_metadata:
-                val = row[col]
-                if pd.notna(val):
-                    metadata[col] = val
-                    logging.debug(f"Row {row.name}: Added '{col}': '{val}' to metadata.")
+        for col in metadata_columns:
+            val = row[col]
+            if pd.notna(val):
+                metadata[col] = val
+                logger.debug("Row %s: Added %r: %r to metadata.", index, col, val)
         return metadata
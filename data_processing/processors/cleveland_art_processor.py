@@ -5,13 +5,13 @@ The rest should be easier!
 
 import pandas as pd
 import re
-from typing import Any
+from typing import Any, Dict
 
 from processors.base_processor import BaseMuseumDataProcessor
 from models.data_models import DateInfo, DateType, Artist, Image
 
 
-def parse_date(raw_val: Any, row: pd.Series) -> DateInfo:
+def parse_date(raw_val: Any, row: Dict[str, Any]) -> DateInfo:
     """
     Parses various date formats and returns a DateInfo object.
     Handles both CE and BCE dates, and abbreviated year ranges.
@@ -93,7 +93,7 @@ def parse_date(raw_val: Any, row: pd.Series) -> DateInfo:
             end_year=years[0],
         )
 
-def parse_creators(raw_val: Any, row: pd.Series) -> Artist:
+def parse_creators(raw_val: Any, row: Dict[str, Any]) -> Artist:
     """
     Example for Cleveland's 'creators' field, returning an Artist object.
     Extracts name, birth year, and death year from strings like:
@@ -120,7 +120,7 @@ def parse_creators(raw_val: Any, row: pd.Series) -> Artist:
     return Artist(name=name, birth_year=birth_year, death_year=death_year)
 
 
-def parse_images(raw_val: Any, row: pd.Series) -> list[Image]:
+def parse_images(raw_val: Any, row: Dict[str, Any]) -> list[Image]:
     """
     Cleveland has 3 columns: image_web, image_print, image_full
     Each image column will use the 'share_license_status' for copyright.
@@ -160,10 +160,10 @@ class ClevelandMuseumDataProcessor(BaseMuseumDataProcessor):
         "url": {"model": "web_url"},
     }
 
-    exclude_from_metadata = {
+    exclude_from_metadata = frozenset({
         "id", "title", "type", "creation_date",
         "creators", "image_web", "image_print", "image_full", "url"
-    }
+    })
 
 
 if __name__ == "__main__":
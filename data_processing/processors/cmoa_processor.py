@@ -5,7 +5,7 @@ Here was the ChatGPT chat URL: https://chatgpt.com/c/676f8192-6fc8-8012-9d3b-03b
 """
 import pandas as pd
 import re
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from processors.base_processor import BaseMuseumDataProcessor
 from models.data_models import (
@@ -33,7 +33,7 @@ def extract_year(date_str: str) -> Optional[int]:
 
 
 
-def parse_cmoa_date(raw_val: Any, row: pd.Series) -> DateInfo:
+def parse_cmoa_date(raw_val: Any, row: Dict[str, Any]) -> DateInfo:
     """
     Parse CMOA's date fields into a DateInfo object.
 
@@ -121,7 +121,7 @@ def parse_cmoa_date(raw_val: Any, row: pd.Series) -> DateInfo:
     )
 
 
-def parse_cmoa_artist(raw_val: Any, row: pd.Series) -> Artist:
+def parse_cmoa_artist(raw_val: Any, row: Dict[str, Any]) -> Artist:
     """
     Parse artist info from multiple columns:
       - full_name (string)
@@ -144,7 +144,7 @@ def parse_cmoa_artist(raw_val: Any, row: pd.Series) -> Artist:
     )
 
 
-def parse_cmoa_images(raw_val: Any, row: pd.Series) -> list[Image]:
+def parse_cmoa_images(raw_val: Any, row: Dict[str, Any]) -> list[Image]:
     """
     The CSV has a single 'image_url' column. We convert it to our standard list[Image].
     """
@@ -181,7 +181,7 @@ class CarnegieMuseumDataProcessor(BaseMuseumDataProcessor):
     }
 
     # Any columns we don't want in metadata
-    exclude_from_metadata = {
+    exclude_from_metadata = frozenset({
         "id",
         "title",
         "creation_date",
@@ -191,7 +191,7 @@ class CarnegieMuseumDataProcessor(BaseMuseumDataProcessor):
         "image_url",
         "full_name",
         "web_url",
-    }
+    })
 
 
 if __name__ == "__main__":
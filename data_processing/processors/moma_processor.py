@@ -1,6 +1,6 @@
 import pandas as pd
 import re
-from typing import Any, Optional, List
+from typing import Any, Dict, Optional, List
 
 from processors.base_processor import BaseMuseumDataProcessor
 from models.data_models import (
@@ -14,7 +14,7 @@ from models.data_models import (
 )
 
 
-def parse_moma_date(raw_val: Any, row: pd.Series) -> DateInfo:
+def parse_moma_date(raw_val: Any, row: Dict[str, Any]) -> DateInfo:
     """
     Parse MOMA's date formats into a DateInfo object.
 
@@ -57,7 +57,7 @@ def parse_moma_date(raw_val: Any, row: pd.Series) -> DateInfo:
     )
 
 
-def parse_moma_artist(raw_val: Any, row: pd.Series) -> Artist:
+def parse_moma_artist(raw_val: Any, row: Dict[str, Any]) -> Artist:
     """
     Parse MOMA's artist information from multiple columns:
     - Artist (name)
@@ -107,7 +107,7 @@ def parse_moma_artist(raw_val: Any, row: pd.Series) -> Artist:
     )
 
 
-def parse_moma_images(raw_val: Any, row: pd.Series) -> list[Image]:
+def parse_moma_images(raw_val: Any, row: Dict[str, Any]) -> list[Image]:
     """
     Parse MOMA's image URLs.
     ImageURL column contains full URLs to images.
@@ -145,7 +145,7 @@ class MoMADataProcessor(BaseMuseumDataProcessor):
     }
 
     # Columns we don't want in metadata
-    exclude_from_metadata = {
+    exclude_from_metadata = frozenset({
         "ObjectID",
         "Title",
         "Date",
@@ -156,7 +156,7 @@ class MoMADataProcessor(BaseMuseumDataProcessor):
         "BeginDate",
         "EndDate",
         "ArtistBio"
-    }
+    })
 
 
 if __name__ == "__main__":
@@ -1,17 +1,19 @@
 import pandas as pd
-from typing import Any
+from typing import Any, Dict
 
 from processors.base_processor import BaseMuseumDataProcessor
 from models.data_models import (
     DateInfo,
     DateType,
     Artist,
-    Image,
-    UnifiedArtwork
+    Image
 )
 
+# Artwork pages are addressed by objectid: {prefix}{objectid}.html
+NGA_OBJECT_URL_PREFIX = "https://www.nga.gov/collection/art-object-page."
 
-def parse_nga_date(raw_val: Any, row: pd.Series) -> DateInfo:
+
+def parse_nga_date(raw_val: Any, row: Dict[str, Any]) -> DateInfo:
     """
     Parse NGA date formats into a DateInfo object.
     Uses displaydate for display_text, and beginyear/endyear for actual years.
@@ -68,7 +70,7 @@ def parse_nga_date(raw_val: Any, row: pd.Series) -> DateInfo:
     )
 
 
-def parse_nga_artist(raw_val: Any, row: pd.Series) -> Artist:
+def parse_nga_artist(raw_val: Any, row: Dict[str, Any]) -> Artist:
     """
     Parse artist information from attribution field.
     Returns Artist with just the name, as birth/death years aren't provided.
@@ -83,7 +85,7 @@ def parse_nga_artist(raw_val: Any, row: pd.Series) -> Artist:
     )
 
 
-def parse_nga_images(raw_val: Any, row: pd.Series) -> list[Image]:
+def parse_nga_images(raw_val: Any, row: Dict[str, Any]) -> list[Image]:
     """
     Currently no image URLs in the sample data.
     This is a placeholder for when image data becomes available.
@@ -91,17 +93,6 @@ def parse_nga_images(raw_val: Any, row: pd.Series) -> list[Image]:
     return []
 
 
-def parse_nga_web_url(raw_val: Any, row: pd.Series) -> str:
-    """
-    Generate the URL using the objectid. The `raw_val` is not used directly;
-    we rely on row['objectid'] instead.
-    """
-    object_id = row.get("objectid")
-    if pd.notna(object_id):
-        return f"https://www.nga.gov/collection/art-object-page.{object_id}.html"
-    return ""
-
-
 class NGADataProcessor(BaseMuseumDataProcessor):
     """
     Processor for National Gallery of Art (DC) open data.
@@ -109,7 +100,18 @@ class NGADataProcessor(BaseMuseumDataProcessor):
 
     def load_data(self, file_path: str, dev_mode: bool = False) -> pd.DataFrame:
         nrows = self.DEV_MODE_ROWS if dev_mode else None
-        return pd.read_csv(file_path, encoding='utf-8', low_memory=False, nrows=nrows)
+        df = pd.read_csv(file_path, encoding='utf-8', low_memory=False, nrows=nrows)
+
+        # Nullable ints keep IDs like 1234 from turning into 1234.0 when some are missing;
+        # non-numeric or fractional IDs become NA so only that row loses its id/URL.
+        # Stored as strings to match UnifiedArtwork.id.
+        object_ids = pd.to_numeric(df["objectid"], errors="coerce")
+        object_ids = object_ids.where(object_ids % 1 == 0)
+        df["objectid"] = object_ids.astype("Int64").astype("string")
+
+        # Build the artwork URLs for the whole column at once (missing IDs stay NA)
+        df["web_url"] = NGA_OBJECT_URL_PREFIX + df["objectid"] + ".html"
+        return df
 
     def get_museum_name(self) -> str:
         return "National Gallery of Art"
@@ -121,10 +123,12 @@ class NGADataProcessor(BaseMuseumDataProcessor):
         "displaydate": {"parse": parse_nga_date, "model": "object.creation_date"},
         "medium": {"model": "object.type"},
         "attribution": {"parse": parse_nga_artist, "model": "artist"},
+        # Generated from objectid in load_data
+        "web_url": {"model": "web_url"},
     }
 
     # Columns to exclude from metadata
-    exclude_from_metadata = {
+    exclude_from_metadata = frozenset({
         "objectid",
         "title",
         "displaydate",
@@ -134,19 +138,7 @@ class NGADataProcessor(BaseMuseumDataProcessor):
         "attribution",
         "attributioninverted",
         "url"
-    }
-
-    # Overriding
-    def _row_to_artwork(self, row: pd.Series, index) -> UnifiedArtwork:
-        # Let the base processor do the heavy lifting first
-        artwork = super()._row_to_artwork(row, index)
-
-        # Now, create the web_url from objectid, even if 'url' column doesn't exist.
-        object_id = row.get("objectid")
-        if pd.notna(object_id):
-            artwork.web_url = f"https://www.nga.gov/collection/art-object-page.{object_id}.html"
-
-        return artwork
+    })
 
 
 if __name__ == "__main__":